@@ -19,7 +19,8 @@ import curses
 import os
 import sys
 import time
-import random
+import queue
+import select
 import threading
 import subprocess
 import atexit
@@ -28,6 +29,13 @@ from enum import Enum, auto
 from dataclasses import dataclass, field
 from typing import List, Dict, Optional, Tuple
 
+import numpy as np
+
+try:
+    import numba
+except ImportError:  # Optional JIT; the spatial-hash path covers its absence
+    numba = None
+
 # Global audio manager reference for cleanup on crash/exit
 _audio_manager: Optional['AudioManager'] = None
 
@@ -36,14 +44,8 @@ def _cleanup_audio():
     """Global cleanup function to stop audio on any exit."""
     global _audio_manager
     if _audio_manager:
+        # stop() kills the tracked afplay pid directly; no pkill sweep
         _audio_manager.stop()
-    # Also kill any stray afplay processes as a safety net
-    try:
-        subprocess.run(['pkill', '-9', 'afplay'],
-                      stdout=subprocess.DEVNULL,
-                      stderr=subprocess.DEVNULL)
-    except Exception:
-        pass
 
 
 def _signal_handler(signum, frame):
@@ -64,7 +66,7 @@ signal.signal(signal.SIGTERM, _signal_handler)
 PLAYER_START_LIVES = 5
 MAX_LIVES = 9  # Cap on maximum lives
 TARGET_FPS = 60
-FRAME_TIME = 1.0 / TARGET_FPS
+FRAME_NS = 1_000_000_000 // TARGET_FPS  # Frame budget in integer nanoseconds
 
 # Screen dimensions (will be adjusted based on terminal size)
 MIN_WIDTH = 60
@@ -77,15 +79,16 @@ ALIEN_SPACING_X = 4
 ALIEN_SPACING_Y = 2
 ALIEN_START_Y = 3
 
+# Alien animation flips every 2**ANIMATION_TICK_SHIFT update ticks
+# (~0.53 s at 60 FPS); frame parity is derived from the tick counter
+ANIMATION_TICK_SHIFT = 5
+
 # Movement speeds
 PLAYER_SPEED = 1
 ALIEN_MOVE_INTERVAL = 0.5  # seconds between alien movements
 PLAYER_PROJECTILE_SPEED = 1.0   # Player laser speed
 ALIEN_PROJECTILE_SPEED = 0.4    # Alien laser speed (slower = easier to dodge)
 
-# Input responsiveness (lower = faster lateral movement via quicker key repeat)
-INPUT_TIMEOUT_MS = 8  # milliseconds to wait for input (default was ~16ms at 60fps)
-
 # Firing configuration (reduced by 1/3 from original)
 BASE_FIRE_PROBABILITY = 0.00133  # Base probability per alien per frame (was 0.002)
 MAX_FIRE_PROBABILITY = 0.0133    # Maximum probability in frenzy mode (was 0.02)
@@ -97,9 +100,24 @@ ALIEN_CHARS = [
     ["<O>", "<o>"],    # Type 2 animation frames
     ["/M\\", "\\W/"],  # Type 3 animation frames
 ]
+# Same glyphs pre-flattened to a (type, frame, column) array of single
+# codepoints so the renderer can gather a whole formation's characters
+# with one NumPy indexing op instead of per-alien string indexing
+ALIEN_GLYPHS = np.array([[list(frame) for frame in pair]
+                         for pair in ALIEN_CHARS], dtype='<U1')
+
 PROJECTILE_PLAYER = "|"
 PROJECTILE_ALIEN = "!"
 BUNKER_CHARS = ['O', 'o', '.']  # Erosion states: full, damaged, nearly destroyed
+# Same states indexed by health (0..3) for vectorized bunker stamping
+BUNKER_GLYPHS = np.array([' '] + BUNKER_CHARS[::-1], dtype='<U1')
+
+# Terminals known to support DEC mode 2026 (synchronized output).
+# Frames wrapped in these escapes are presented atomically, eliminating
+# tearing/flicker at 60 FPS. Matched against $TERM / $TERM_PROGRAM.
+SYNC_OUTPUT_TERMS = ('ghostty', 'kitty', 'iterm', 'wezterm', 'contour')
+SYNC_BEGIN = b'\x1b[?2026h'
+SYNC_END = b'\x1b[?2026l'
 
 # Color pairs
 COLOR_PLAYER = 1
@@ -126,6 +144,39 @@ class GameState(Enum):
 # HELPER FUNCTIONS
 # ============================================================================
 
+def supports_sync_output() -> bool:
+    """
+    Check whether the terminal supports DEC 2026 synchronized output.
+
+    Returns:
+        True if $TERM or $TERM_PROGRAM matches a known-good terminal.
+    """
+    term = '{}:{}'.format(os.environ.get('TERM', ''),
+                          os.environ.get('TERM_PROGRAM', '')).lower()
+    return any(name in term for name in SYNC_OUTPUT_TERMS)
+
+
+def _first_alien_hit(px, py, alien_x, alien_y, alien_alive):
+    """
+    Index of the first alive alien within +/-1 of (px, py), or -1.
+
+    Pure numeric kernel over the alien SoA columns; compiled with numba
+    when available (see below), in which case it replaces the dict-based
+    spatial-hash lookup in the collision path.
+    """
+    for i in range(alien_x.shape[0]):
+        if alien_alive[i]:
+            dx = alien_x[i] - px
+            dy = alien_y[i] - py
+            if -1 <= dx <= 1 and -1 <= dy <= 1:
+                return i
+    return -1
+
+
+if numba is not None:
+    _first_alien_hit = numba.njit(cache=True)(_first_alien_hit)
+
+
 def resolve_audio_path() -> str:
     """
     Resolve the audio file path using os.path.expanduser.
@@ -140,7 +191,7 @@ def resolve_audio_path() -> str:
 # DATA CLASSES
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class Player:
     """Player ship with position and lives."""
     x: int = 0
@@ -159,7 +210,7 @@ class Player:
         self.lives = PLAYER_START_LIVES
 
 
-@dataclass
+@dataclass(slots=True)
 class Alien:
     """Individual alien with position and type."""
     x: int
@@ -172,7 +223,7 @@ class Alien:
         pass
 
 
-@dataclass
+@dataclass(slots=True)
 class Bunker:
     """Defensive bunker that erodes on hits."""
     x: int
@@ -195,7 +246,7 @@ class Bunker:
         return self.health <= 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Projectile:
     """Projectile fired by player or alien."""
     x: int
@@ -215,9 +266,11 @@ class AudioManager:
     """
 
     def __init__(self):
-        self.game_running = True
+        self._stop_evt = threading.Event()
         self.audio_thread: Optional[threading.Thread] = None
         self.current_process: Optional[subprocess.Popen] = None
+        self._audio_path: Optional[str] = None
+        self._popen_args: Tuple[str, ...] = ()
 
     def start(self) -> None:
         """Start the audio loop in a daemon thread."""
@@ -225,29 +278,35 @@ class AudioManager:
         if not os.path.exists(audio_path):
             return  # No audio file, skip silently
 
+        # Resolve once; the loop replays the same file for the whole session
+        self._audio_path = audio_path
+        self._popen_args = ('afplay', audio_path)
+
         self.audio_thread = threading.Thread(target=self._audio_loop, daemon=True)
         self.audio_thread.start()
 
     def _audio_loop(self) -> None:
         """Main audio loop - plays soundtrack repeatedly."""
-        audio_path = resolve_audio_path()
-
-        while self.game_running:
+        while not self._stop_evt.is_set():
             try:
-                # Using subprocess.call blocks until playback completes
-                # Then loop restarts immediately
                 self.current_process = subprocess.Popen(
-                    ['afplay', audio_path],
+                    self._popen_args,
                     stdout=subprocess.DEVNULL,
                     stderr=subprocess.DEVNULL
                 )
-                self.current_process.wait()
+                # Poll the child against the stop event instead of a bare
+                # wait(), so stop() takes effect within 0.1 s rather than
+                # after the remaining track length
+                while self.current_process.poll() is None:
+                    if self._stop_evt.wait(0.1):
+                        self.current_process.terminate()
+                        break
             except Exception:
                 break  # Exit on any error
 
     def stop(self) -> None:
         """Stop audio playback and clean up."""
-        self.game_running = False
+        self._stop_evt.set()
 
         # Kill any running afplay process
         if self.current_process:
@@ -260,13 +319,12 @@ class AudioManager:
                 except Exception:
                     pass
 
-        # Also kill any stray afplay processes
+        # Safety net: a single kill syscall on the tracked pid instead
+        # of forking pkill to scan the whole process table
         try:
-            subprocess.run(['pkill', '-9', 'afplay'],
-                          stdout=subprocess.DEVNULL,
-                          stderr=subprocess.DEVNULL)
-        except Exception:
-            pass
+            os.kill(self.current_process.pid, signal.SIGKILL)
+        except (ProcessLookupError, AttributeError):
+            pass  # Already gone, or never started
 
 
 class SoundEffects:
@@ -295,31 +353,55 @@ class SoundEffects:
 
     def __init__(self):
         self.enabled = True
-        self.march_beat = 0  # Alternates between 0 and 1
-        self.last_march_time = 0
-        self.march_interval = 0.5  # Starting interval (speeds up)
+        self.march_count = 0  # Beat parity is march_count & 1
+        self.last_march_ns = 0
+        self.march_interval_ns = 500_000_000  # Starting interval (speeds up)
         self._verify_sounds()
 
-    def _verify_sounds(self):
-        """Check which sounds are available."""
-        self.available_sounds = {}
-        for name, path in self.SOUNDS.items():
-            self.available_sounds[name] = os.path.exists(path)
-
-    def _play_async(self, sound_name: str, volume: float = 0.5):
-        """Play a sound asynchronously (non-blocking)."""
-        if not self.enabled:
-            return
-        if sound_name not in self.SOUNDS:
-            return
-        if not self.available_sounds.get(sound_name, False):
+        # Single worker thread with a bounded queue instead of a fresh
+        # thread (and its startup cost) per sound event; when the queue
+        # is full under frenzy-mode load, events are simply dropped.
+        self._queue: queue.Queue = queue.Queue(maxsize=8)
+        self._worker = threading.Thread(target=self._worker_loop, daemon=True)
+        self._worker.start()
+
+        # Preloaded in-process players (PyObjC AVFoundation) play with
+        # microsecond latency and no per-event afplay fork; events fall
+        # back to the worker queue when PyObjC isn't installed.
+        self._players: Dict[str, object] = {}
+        self._preload_players()
+
+    def _preload_players(self):
+        """Preload each available sound into an AVAudioPlayer, if possible."""
+        try:
+            from AVFoundation import AVAudioPlayer
+            from Foundation import NSURL
+        except ImportError:
             return
 
-        def play():
+        for name, path in self.SOUNDS.items():
+            if name not in self._playable:
+                continue
+            try:
+                url = NSURL.fileURLWithPath_(path)
+                player, _error = (AVAudioPlayer.alloc()
+                                  .initWithContentsOfURL_error_(url, None))
+                if player is not None:
+                    player.prepareToPlay()
+                    self._players[name] = player
+            except Exception:
+                pass  # Leave this sound on the afplay fallback
+
+    def _worker_loop(self):
+        """Drain queued sound events, one afplay at a time."""
+        while True:
+            sound_name, volume = self._queue.get()
             try:
                 # afplay with volume control
+                cmd = self._cmds[sound_name]
+                cmd[2] = str(volume)
                 subprocess.run(
-                    ['afplay', '-v', str(volume), self.SOUNDS[sound_name]],
+                    cmd,
                     stdout=subprocess.DEVNULL,
                     stderr=subprocess.DEVNULL,
                     timeout=2
@@ -327,8 +409,36 @@ class SoundEffects:
             except Exception:
                 pass
 
-        thread = threading.Thread(target=play, daemon=True)
-        thread.start()
+    def _verify_sounds(self):
+        """Check which sounds are available."""
+        self._playable = frozenset(
+            name for name, path in self.SOUNDS.items() if os.path.exists(path)
+        )
+        # afplay argv templates; only the volume slot (index 2) varies
+        # per event, and only the worker thread mutates it
+        self._cmds = {
+            name: ['afplay', '-v', '0.5', self.SOUNDS[name]]
+            for name in self._playable
+        }
+
+    def _play_async(self, sound_name: str, volume: float = 0.5):
+        """Play a sound asynchronously (non-blocking)."""
+        # Playability subsumes SOUNDS membership, so one check suffices
+        if not self.enabled or sound_name not in self._playable:
+            return
+
+        player = self._players.get(sound_name)
+        if player is not None:
+            # In-process playback: no thread, no fork
+            player.setVolume_(volume)
+            player.setCurrentTime_(0.0)
+            player.play()
+            return
+
+        try:
+            self._queue.put_nowait((sound_name, volume))
+        except queue.Full:
+            pass  # Drop the event rather than stall the game loop
 
     def play_shoot(self):
         """Player shooting sound."""
@@ -358,23 +468,25 @@ class SoundEffects:
         if alien_count <= 0:
             return
 
-        current_time = time.time()
+        now_ns = time.perf_counter_ns()
 
         # Calculate march speed based on remaining aliens
         # Fewer aliens = faster beat (more tense!)
         ratio = alien_count / total_aliens
-        # Interval ranges from 0.5s (full) to 0.1s (almost empty)
-        self.march_interval = 0.1 + (ratio * 0.4)
-
-        if current_time - self.last_march_time >= self.march_interval:
-            # Alternate between two beat sounds
-            if self.march_beat == 0:
+        # Interval ranges from 0.5s (full) to 0.1s (almost empty),
+        # kept as integer nanoseconds so the hot compare is int-vs-int
+        self.march_interval_ns = 100_000_000 + int(ratio * 400_000_000)
+
+        if now_ns - self.last_march_ns >= self.march_interval_ns:
+            # Alternate between two beat sounds; parity comes from the
+            # beat counter rather than a read-modify-write toggle
+            if self.march_count & 1 == 0:
                 self._play_async('march1', 0.2)
             else:
                 self._play_async('march2', 0.2)
 
-            self.march_beat = 1 - self.march_beat
-            self.last_march_time = current_time
+            self.march_count += 1
+            self.last_march_ns = now_ns
 
 
 # ============================================================================
@@ -405,6 +517,14 @@ class Game:
         self.score = 0
         self.level = 1
 
+        # Per-level movement interval, precomputed in ns and indexed by
+        # level instead of decrementing a mutable module global
+        self._move_interval_ns_table = [
+            int(max(0.1, ALIEN_MOVE_INTERVAL - 0.05 * i) * 1e9)
+            for i in range(32)
+        ]
+        self._move_interval_ns = self._move_interval_ns_table[0]
+
         # Screen dimensions (defaults for test mode)
         self.width = 80
         self.height = 24
@@ -414,20 +534,60 @@ class Game:
         self._init_player_position()
 
         # Game entities
-        self.aliens: List[Alien] = []
-        self.player_projectiles: List[Dict] = []
-        self.alien_projectiles: List[Dict] = []
-        self.bunkers: List[Bunker] = []
-
-        # Animation state
-        self.alien_animation_frame = 0
-        self.last_animation_time = time.time()
+        # Aliens are stored structure-of-arrays style: parallel NumPy columns
+        # instead of a list of Alien objects, so per-frame movement, firing
+        # and collision checks are single vectorized ops rather than Python
+        # loops over ~55 scattered instances.
+        self.alien_x = np.zeros(0, dtype=np.int16)
+        self.alien_y = np.zeros(0, dtype=np.int16)
+        self.alien_type = np.zeros(0, dtype=np.int8)
+        self.alien_alive = np.zeros(0, dtype=bool)
+
+        # Bunkers use the same SoA layout as aliens: parallel coordinate
+        # and health columns, plus a spatial hash mapping cell coordinate
+        # -> column index so projectile hit tests are O(1) dict lookups.
+        # (Alien hits use a broadcast distance test over the SoA columns.)
+        self.bunker_x = np.zeros(0, dtype=np.int16)
+        self.bunker_y = np.zeros(0, dtype=np.int16)
+        self.bunker_health = np.zeros(0, dtype=np.int8)
+        self._bunker_cells: Dict[Tuple[int, int], int] = {}
+
+        # RNG for vectorized alien firing draws
+        self._rng = np.random.default_rng()
+
+        # Frenzy-mode fire probability per remaining-alien count,
+        # precomputed once: the per-frame interpolation becomes a table load
+        total = ALIEN_ROWS * ALIEN_COLS
+        self._fire_prob_table = np.minimum(
+            BASE_FIRE_PROBABILITY
+            + (1 - np.arange(total + 1) / total)
+            * (MAX_FIRE_PROBABILITY - BASE_FIRE_PROBABILITY),
+            MAX_FIRE_PROBABILITY
+        )
+
+        # Projectiles are (x, y) rows of float32 SoA arrays; position
+        # updates and off-screen pruning are single vector ops instead of
+        # dict mutation plus list.remove(). The dict-list API survives as
+        # the player_projectiles/alien_projectiles properties.
+        self._pproj = np.empty((0, 2), dtype=np.float32)
+        self._aproj = np.empty((0, 2), dtype=np.float32)
+
+        # Animation state: frame parity is (tick >> ANIMATION_TICK_SHIFT) & 1,
+        # a pure function of the update counter with no stored toggle.
+        # The current frame's glyph plane is cached contiguously and only
+        # re-sliced when the parity flips (~2 Hz), not every render.
+        self.tick = 0
+        self._glyph_frame = 0
+        self._frame_glyphs = np.ascontiguousarray(ALIEN_GLYPHS[:, 0])
         self.alien_direction = 1  # 1=right, -1=left
-        self.last_alien_move_time = time.time()
+        # Timed events are absolute monotonic-ns deadlines: one clock
+        # sample per update and an int compare per event, immune to
+        # wall-clock jumps
+        self._next_move_ns = time.monotonic_ns() + self._move_interval_ns
 
         # Flash effect state
         self.flash_active = False
-        self.flash_end_time = 0
+        self._flash_end_ns = 0
 
         # Audio
         self.audio: Optional[AudioManager] = None
@@ -440,6 +600,17 @@ class Game:
         # Curses screen
         self.screen = None
 
+        # Shadow frame buffers for damage-tracked rendering (re-allocated
+        # in run() once the real terminal size is known)
+        self._init_frame_buffers()
+
+        # Atomic frame presentation on supporting terminals
+        self._sync_output = False if test_mode else supports_sync_output()
+
+        # Attribute cache (re-filled with real values once curses colors
+        # are initialized in run())
+        self._init_attrs(live=False)
+
         # Level completion bonus tracking
         self.lives_awarded = 0  # Lives awarded at last level completion
 
@@ -457,28 +628,141 @@ class Game:
 
     def _init_aliens(self) -> None:
         """Create the initial alien grid."""
-        self.aliens = []
         start_x = (self.width - (ALIEN_COLS * ALIEN_SPACING_X)) // 2
+        total = ALIEN_ROWS * ALIEN_COLS
+
+        # Build the SoA columns directly from the row/col lattice: exact
+        # final sizes, no per-alien object construction or appends
+        rows = np.arange(ALIEN_ROWS, dtype=np.int16)
+        cols = np.arange(ALIEN_COLS, dtype=np.int16)
+        self.alien_x = np.tile(start_x + cols * ALIEN_SPACING_X, ALIEN_ROWS)
+        self.alien_y = np.repeat(ALIEN_START_Y + rows * ALIEN_SPACING_Y,
+                                 ALIEN_COLS)
+        self.alien_type = np.repeat((rows // 2) % 3,
+                                    ALIEN_COLS).astype(np.int8)
+        self.alien_alive = np.ones(total, dtype=bool)
+        self.alive_bits = (1 << total) - 1
+        self._fire_draws = np.empty(total)
+        self._alive_idx = None
+        self._recompute_alien_bounds()
+
+    def _load_aliens(self, aliens: List[Alien]) -> None:
+        """Load a list of Alien objects into the SoA columns."""
+        self.alien_x = np.array([a.x for a in aliens], dtype=np.int16)
+        self.alien_y = np.array([a.y for a in aliens], dtype=np.int16)
+        self.alien_type = np.array([a.alien_type for a in aliens], dtype=np.int8)
+        self.alien_alive = np.array([a.alive for a in aliens], dtype=bool)
+        # Packed alive mask: the 55-alien grid fits in one int, so the
+        # per-frame count is a single bit_count() (POPCNT) instead of a
+        # scan. Kept in sync with the alien_alive column at kill sites.
+        self.alive_bits = int(sum(1 << int(i)
+                                  for i in np.flatnonzero(self.alien_alive)))
+        # Reused per-frame scratch for the firing draw (no allocation per tick)
+        self._fire_draws = np.empty(len(aliens))
+        self._alive_idx = None
+        self._recompute_alien_bounds()
+
+    def _recompute_alien_bounds(self) -> None:
+        """Recompute the cached formation bounds from the alive columns."""
+        if self.alive_bits:
+            alive = self.alien_alive
+            xs = self.alien_x[alive]
+            self._alien_min_x = int(xs.min())
+            self._alien_max_x = int(xs.max())
+            self._alien_max_y = int(self.alien_y[alive].max())
+        else:
+            self._alien_min_x = 0
+            self._alien_max_x = 0
+            self._alien_max_y = 0
 
-        for row in range(ALIEN_ROWS):
-            alien_type = row // 2  # Different types per rows
-            for col in range(ALIEN_COLS):
-                x = start_x + col * ALIEN_SPACING_X
-                y = ALIEN_START_Y + row * ALIEN_SPACING_Y
-                self.aliens.append(Alien(x=x, y=y, alien_type=alien_type % 3))
+    def _alive_indices(self) -> np.ndarray:
+        """
+        Indices of live aliens, scanned at most once per frame.
+
+        The update and render passes both need this set; caching it means
+        the alive column is swept once and the result shared, invalidated
+        only at kill sites.
+        """
+        if self._alive_idx is None:
+            self._alive_idx = np.flatnonzero(self.alien_alive)
+        return self._alive_idx
+
+    def _kill_alien(self, i: int) -> None:
+        """Mark alien i dead and update the derived alive state and score."""
+        self.alien_alive[i] = False
+        self.alive_bits &= ~(1 << i)
+        self._alive_idx = None
+        # Only a death on a boundary column or the bottom row can move
+        # the cached bounds
+        x = int(self.alien_x[i])
+        if (x == self._alien_min_x or x == self._alien_max_x
+                or int(self.alien_y[i]) == self._alien_max_y):
+            self._recompute_alien_bounds()
+        self.score += 10 * (3 - int(self.alien_type[i]))
+        if self.sfx:
+            self.sfx.play_alien_die()
+
+    @property
+    def aliens(self) -> List[Alien]:
+        """
+        Live aliens as a list of Alien objects.
+
+        Compatibility/rendering glue over the SoA columns; the hot paths
+        (movement, firing, collisions) operate on the arrays directly.
+        """
+        return [
+            Alien(x=int(self.alien_x[i]), y=int(self.alien_y[i]),
+                  alien_type=int(self.alien_type[i]))
+            for i in self._alive_indices()
+        ]
+
+    @aliens.setter
+    def aliens(self, aliens: List[Alien]) -> None:
+        self._load_aliens(aliens)
+
+    @property
+    def player_projectiles(self) -> List[Dict]:
+        """Player shots as {'x', 'y'} dicts (compatibility glue)."""
+        return [{'x': int(x), 'y': float(y)} for x, y in self._pproj]
+
+    @player_projectiles.setter
+    def player_projectiles(self, projectiles: List[Dict]) -> None:
+        self._pproj = np.array([[p['x'], p['y']] for p in projectiles],
+                               dtype=np.float32).reshape(-1, 2)
+
+    @property
+    def alien_projectiles(self) -> List[Dict]:
+        """Alien shots as {'x', 'y'} dicts (compatibility glue)."""
+        return [{'x': int(x), 'y': float(y)} for x, y in self._aproj]
+
+    @alien_projectiles.setter
+    def alien_projectiles(self, projectiles: List[Dict]) -> None:
+        self._aproj = np.array([[p['x'], p['y']] for p in projectiles],
+                               dtype=np.float32).reshape(-1, 2)
 
     def _init_bunkers(self) -> None:
         """Create defensive bunkers."""
-        self.bunkers = []
         bunker_y = self.height - 6
         bunker_spacing = self.width // 5
 
-        for i in range(4):
-            bunker_x = bunker_spacing * (i + 1) - 2
-            # Create bunker block (3x2)
-            for dx in range(-1, 2):
-                for dy in range(2):
-                    self.bunkers.append(Bunker(x=bunker_x + dx, y=bunker_y + dy))
+        # Four 3x2 bunker blocks, laid out straight into the SoA columns
+        cells = [(bunker_spacing * (i + 1) - 2 + dx, bunker_y + dy)
+                 for i in range(4)
+                 for dx in range(-1, 2)
+                 for dy in range(2)]
+        self.bunker_x = np.array([x for x, _ in cells], dtype=np.int16)
+        self.bunker_y = np.array([y for _, y in cells], dtype=np.int16)
+        self.bunker_health = np.full(len(cells), 3, dtype=np.int8)
+        self._bunker_cells = {cell: i for i, cell in enumerate(cells)}
+
+    @property
+    def bunkers(self) -> List[Bunker]:
+        """Standing bunker cells as Bunker objects (compatibility glue)."""
+        return [
+            Bunker(x=int(self.bunker_x[i]), y=int(self.bunker_y[i]),
+                   health=int(self.bunker_health[i]))
+            for i in np.flatnonzero(self.bunker_health > 0)
+        ]
 
     def get_alien_fire_probability(self) -> float:
         """
@@ -488,20 +772,14 @@ class Game:
         Returns:
             Probability of each alien firing per frame.
         """
-        if not self.aliens:
+        remaining = self.alive_bits.bit_count()
+        if remaining == 0:
             return 0
 
-        # Calculate ratio of destroyed aliens
-        total_aliens = ALIEN_ROWS * ALIEN_COLS
-        remaining = len(self.aliens)
-        destroyed_ratio = 1 - (remaining / total_aliens)
-
-        # Linear interpolation between base and max probability
-        probability = BASE_FIRE_PROBABILITY + (
-            destroyed_ratio * (MAX_FIRE_PROBABILITY - BASE_FIRE_PROBABILITY)
-        )
-
-        return min(probability, MAX_FIRE_PROBABILITY)
+        # Table lookup, clamped in case a caller loads an oversized grid
+        table = self._fire_prob_table
+        idx = remaining if remaining < table.size else table.size - 1
+        return float(table[idx])
 
     def handle_player_damage(self) -> None:
         """
@@ -523,11 +801,11 @@ class Game:
         else:
             # Flash effect
             self.flash_active = True
-            self.flash_end_time = time.time() + 0.2
+            self._flash_end_ns = time.monotonic_ns() + 200_000_000
 
             # Clear projectiles
-            self.player_projectiles.clear()
-            self.alien_projectiles.clear()
+            self._pproj = np.empty((0, 2), dtype=np.float32)
+            self._aproj = np.empty((0, 2), dtype=np.float32)
 
             # Reset player position
             self.player.x = self._initial_player_x
@@ -537,11 +815,9 @@ class Game:
         Check if any alien has reached the player's row.
         Triggers instant GAME_OVER if so.
         """
-        player_y = self.player.y
-        for alien in self.aliens:
-            if alien.y >= player_y:
-                self.state = GameState.GAME_OVER
-                return
+        # The cached bottom row makes this an int compare per frame
+        if self.alive_bits and self._alien_max_y >= self.player.y:
+            self.state = GameState.GAME_OVER
 
     def reset_game(self) -> None:
         """
@@ -556,8 +832,8 @@ class Game:
         self.player.x = self._initial_player_x
 
         # Clear all projectiles
-        self.player_projectiles.clear()
-        self.alien_projectiles.clear()
+        self._pproj = np.empty((0, 2), dtype=np.float32)
+        self._aproj = np.empty((0, 2), dtype=np.float32)
 
         # Re-initialize aliens
         self._init_aliens()
@@ -568,7 +844,7 @@ class Game:
 
         # Reset alien movement
         self.alien_direction = 1
-        self.last_alien_move_time = time.time()
+        self._next_move_ns = time.monotonic_ns() + self._move_interval_ns
 
         # Set state to playing
         self.state = GameState.PLAYING
@@ -578,132 +854,162 @@ class Game:
         if self.state != GameState.PLAYING:
             return
 
-        current_time = time.time()
+        self.tick += 1
+        now = time.monotonic_ns()
 
         # Update flash effect
-        if self.flash_active and current_time >= self.flash_end_time:
+        if self.flash_active and now >= self._flash_end_ns:
             self.flash_active = False
 
-        # Update alien animation
-        if current_time - self.last_animation_time >= 0.5:
-            self.alien_animation_frame = 1 - self.alien_animation_frame
-            self.last_animation_time = current_time
-
         # Move aliens
-        if current_time - self.last_alien_move_time >= ALIEN_MOVE_INTERVAL:
+        if now >= self._next_move_ns:
             self._move_aliens()
-            self.last_alien_move_time = current_time
+            self._next_move_ns = now + self._move_interval_ns
 
-        # Update projectiles
-        self._update_projectiles()
+        # Update projectiles (skipped entirely on quiet frames)
+        if len(self._pproj) or len(self._aproj):
+            self._update_projectiles()
 
         # Alien firing
         self._alien_fire()
 
-        # Check collisions
-        self._check_collisions()
+        # Check collisions (nothing can collide without projectiles)
+        if len(self._pproj) or len(self._aproj):
+            self._check_collisions()
 
         # Check invasion
         self.check_invasion()
 
         # Update marching beat (speeds up as aliens die - iconic Space Invaders sound)
-        if self.sfx and self.aliens:
+        alien_count = self.alive_bits.bit_count()
+        if self.sfx and alien_count:
             total_aliens = ALIEN_ROWS * ALIEN_COLS
-            self.sfx.update_march(len(self.aliens), total_aliens)
+            self.sfx.update_march(alien_count, total_aliens)
 
         # Check level complete
-        if not self.aliens:
+        if alien_count == 0:
             self._next_level()
 
     def _move_aliens(self) -> None:
         """Move alien formation."""
-        if not self.aliens:
+        if not self.alive_bits:
             return
+        alive = self.alien_alive
 
-        # Check bounds
-        min_x = min(a.x for a in self.aliens)
-        max_x = max(a.x for a in self.aliens)
-
-        # Change direction at edges
-        if max_x >= self.width - 4 and self.alien_direction > 0:
+        # Change direction at edges; the cached bounds make this O(1)
+        # per move instead of two full scans of the x column
+        if self._alien_max_x >= self.width - 4 and self.alien_direction > 0:
             self.alien_direction = -1
-            for alien in self.aliens:
-                alien.y += 1
-        elif min_x <= 2 and self.alien_direction < 0:
+            self.alien_y[alive] += 1
+            self._alien_max_y += 1
+        elif self._alien_min_x <= 2 and self.alien_direction < 0:
             self.alien_direction = 1
-            for alien in self.aliens:
-                alien.y += 1
+            self.alien_y[alive] += 1
+            self._alien_max_y += 1
         else:
-            for alien in self.aliens:
-                alien.x += self.alien_direction
+            self.alien_x[alive] += self.alien_direction
+            self._alien_min_x += self.alien_direction
+            self._alien_max_x += self.alien_direction
 
     def _update_projectiles(self) -> None:
         """Update all projectile positions."""
         # Player projectiles move up (faster)
-        for proj in self.player_projectiles[:]:
-            proj['y'] -= PLAYER_PROJECTILE_SPEED
-            if proj['y'] < 0:
-                self.player_projectiles.remove(proj)
+        if len(self._pproj):
+            self._pproj[:, 1] -= PLAYER_PROJECTILE_SPEED
+            self._pproj = self._pproj[self._pproj[:, 1] >= 0]
 
         # Alien projectiles move down (slower for easier dodging)
-        for proj in self.alien_projectiles[:]:
-            proj['y'] += ALIEN_PROJECTILE_SPEED
-            if proj['y'] >= self.height:
-                self.alien_projectiles.remove(proj)
+        if len(self._aproj):
+            self._aproj[:, 1] += ALIEN_PROJECTILE_SPEED
+            self._aproj = self._aproj[self._aproj[:, 1] < self.height]
 
     def _alien_fire(self) -> None:
         """Handle alien firing logic."""
-        if not self.aliens:
-            return
-
         fire_prob = self.get_alien_fire_probability()
+        if fire_prob <= 0:
+            return
 
-        for alien in self.aliens:
-            if random.random() < fire_prob:
-                self.alien_projectiles.append({
-                    'x': alien.x + 1,
-                    'y': alien.y + 1
-                })
+        # One vectorized Bernoulli draw for the whole grid instead of a
+        # Python-level random.random() call per alien per frame.
+        self._rng.random(out=self._fire_draws)
+        live = self._alive_indices()
+        idx = live[self._fire_draws[live] < fire_prob]
+        if idx.size:
+            shots = np.empty((idx.size, 2), dtype=np.float32)
+            shots[:, 0] = self.alien_x[idx] + 1
+            shots[:, 1] = self.alien_y[idx] + 1
+            self._aproj = np.concatenate((self._aproj, shots))
 
     def _check_collisions(self) -> None:
         """Check all collision types."""
         # Player projectiles vs aliens
-        for proj in self.player_projectiles[:]:
-            for alien in self.aliens[:]:
-                if (abs(proj['x'] - alien.x) <= 1 and
-                    abs(proj['y'] - alien.y) <= 1):
-                    self.aliens.remove(alien)
-                    if proj in self.player_projectiles:
-                        self.player_projectiles.remove(proj)
-                    self.score += 10 * (3 - alien.alien_type)
-                    if self.sfx:
-                        self.sfx.play_alien_die()
-                    break
-
-        # Alien projectiles vs player
-        for proj in self.alien_projectiles[:]:
-            if (abs(proj['x'] - self.player.x - 1) <= 1 and
-                proj['y'] >= self.player.y):
-                self.alien_projectiles.remove(proj)
+        n = len(self._pproj)
+        if n and self.alive_bits:
+            keep = np.ones(n, dtype=bool)
+            if numba is not None:
+                # Compiled kernel: scan per projectile
+                for k in range(n):
+                    i = int(_first_alien_hit(int(self._pproj[k, 0]),
+                                             int(self._pproj[k, 1]),
+                                             self.alien_x, self.alien_y,
+                                             self.alien_alive))
+                    if i >= 0:
+                        self._kill_alien(i)
+                        keep[k] = False
+            else:
+                # Broadcast broad phase: one (P, A) distance test in C,
+                # then resolve the (rare) hits in projectile order so
+                # two shots can't claim the same alien
+                px = self._pproj[:, 0].astype(np.int16)
+                py = self._pproj[:, 1].astype(np.int16)
+                hit = ((np.abs(px[:, None] - self.alien_x[None, :]) <= 1) &
+                       (np.abs(py[:, None] - self.alien_y[None, :]) <= 1) &
+                       self.alien_alive[None, :])
+                for k in np.flatnonzero(hit.any(axis=1)):
+                    targets = np.flatnonzero(hit[k] & self.alien_alive)
+                    if targets.size:
+                        self._kill_alien(int(targets[0]))
+                        keep[k] = False
+            if not keep.all():
+                self._pproj = self._pproj[keep]
+
+        # Alien projectiles vs player (mask compaction on hit, like the
+        # other projectile passes)
+        for k in range(len(self._aproj)):
+            if (abs(self._aproj[k, 0] - self.player.x - 1) <= 1 and
+                    self._aproj[k, 1] >= self.player.y):
+                mask = np.ones(len(self._aproj), dtype=bool)
+                mask[k] = False
+                self._aproj = self._aproj[mask]
                 self.handle_player_damage()
                 break
 
         # Projectiles vs bunkers
-        for proj in self.player_projectiles[:]:
-            for bunker in self.bunkers[:]:
-                if bunker.health > 0 and proj['x'] == bunker.x and proj['y'] == bunker.y:
-                    bunker.hit()
-                    if proj in self.player_projectiles:
-                        self.player_projectiles.remove(proj)
-                    break
-
-        for proj in self.alien_projectiles[:]:
-            for bunker in self.bunkers[:]:
-                if bunker.health > 0 and proj['x'] == bunker.x and proj['y'] == bunker.y:
-                    bunker.hit()
-                    if proj in self.alien_projectiles:
-                        self.alien_projectiles.remove(proj)
-                    break
+        self._pproj = self._collide_bunkers(self._pproj)
+        self._aproj = self._collide_bunkers(self._aproj)
+
+    def _collide_bunkers(self, proj: np.ndarray) -> np.ndarray:
+        """
+        Erode bunkers hit by these projectiles; returns the survivors.
+
+        Exact-cell spatial hash lookup: float projectile coordinates only
+        match a cell key when they land exactly on it, same as the old
+        equality test.
+        """
+        if not len(proj) or not self._bunker_cells:
+            return proj
+
+        keep = np.ones(len(proj), dtype=bool)
+        for k in range(len(proj)):
+            i = self._bunker_cells.get((float(proj[k, 0]),
+                                        float(proj[k, 1])))
+            if i is not None:
+                self.bunker_health[i] -= 1
+                if self.bunker_health[i] <= 0:
+                    del self._bunker_cells[(int(self.bunker_x[i]),
+                                            int(self.bunker_y[i]))]
+                keep[k] = False
+        return proj[keep] if not keep.all() else proj
 
     def _next_level(self) -> None:
         """Advance to next level and award bonus lives."""
@@ -724,9 +1030,9 @@ class Game:
         self._init_aliens()
         self._init_bunkers()
 
-        # Speed up aliens slightly each level
-        global ALIEN_MOVE_INTERVAL
-        ALIEN_MOVE_INTERVAL = max(0.1, ALIEN_MOVE_INTERVAL - 0.05)
+        # Speed up aliens slightly each level (table lookup, clamped)
+        idx = min(self.level - 1, len(self._move_interval_ns_table) - 1)
+        self._move_interval_ns = self._move_interval_ns_table[idx]
 
     def handle_input(self, key: int) -> bool:
         """
@@ -751,11 +1057,10 @@ class Game:
                 self.player.x = min(self.width - 3, self.player.x + PLAYER_SPEED)
             elif key == ord(' '):
                 # Fire projectile
-                if len(self.player_projectiles) < 3:  # Limit active projectiles
-                    self.player_projectiles.append({
-                        'x': self.player.x + 1,
-                        'y': self.player.y - 1
-                    })
+                if len(self._pproj) < 3:  # Limit active projectiles
+                    shot = np.array([[self.player.x + 1, self.player.y - 1]],
+                                    dtype=np.float32)
+                    self._pproj = np.concatenate((self._pproj, shot))
                     if self.sfx:
                         self.sfx.play_shoot()
 
@@ -769,18 +1074,130 @@ class Game:
 
         return True
 
+    def _init_attrs(self, live: bool) -> None:
+        """
+        Cache curses attribute ints used by the render path.
+
+        curses.color_pair() is a Python call per lookup; resolving the
+        pairs once removes it from every draw in the hot loop.
+
+        Args:
+            live: True once curses colors are initialized; False gives
+                  harmless zero attrs for test mode.
+        """
+        cp = curses.color_pair if live else (lambda n: 0)
+        bold = curses.A_BOLD if live else 0
+        self.attr = {
+            'player': cp(COLOR_PLAYER),
+            'player_bold': cp(COLOR_PLAYER) | bold,
+            'alien': cp(COLOR_ALIEN),
+            'bunker': cp(COLOR_BUNKER),
+            'text': cp(COLOR_TEXT),
+            'text_bold': cp(COLOR_TEXT) | bold,
+            'projectile': cp(COLOR_PROJECTILE),
+            'game_over': cp(COLOR_GAME_OVER),
+            'game_over_bold': cp(COLOR_GAME_OVER) | bold,
+        }
+
+    def _init_frame_buffers(self) -> None:
+        """Allocate the shadow frame buffers used for damage tracking."""
+        shape = (self.height, self.width)
+        self._curr = np.full(shape, ' ', dtype='<U1')
+        self._prev = np.full(shape, ' ', dtype='<U1')
+        self._curr_attr = np.zeros(shape, dtype=np.int64)
+        # Preallocated blank templates: clearing the compose buffers is a
+        # C-level copy with no per-frame scalar broadcasting or temporaries
+        self._blank_chars = np.full(shape, ' ', dtype='<U1')
+        self._blank_attrs = np.zeros(shape, dtype=np.int64)
+        # Sentinel attrs force a full repaint on the first frame
+        self._prev_attr = np.full(shape, -1, dtype=np.int64)
+        self._flash_drawn = False
+
+        # Screen size is fixed for the session, so regenerate the
+        # size-specialized draw helper whenever the buffers change shape
+        self._gen_safe_addstr()
+
+    def _gen_safe_addstr(self) -> None:
+        """
+        Generate a _safe_addstr specialized for the current screen size.
+
+        Partial evaluation: the terminal dimensions are constant for the
+        session, so the clipping checks are compiled with height/width as
+        literals instead of two attribute loads per call. The generic
+        method below stays as the readable template.
+        """
+        src = (
+            "def _safe_addstr(self, y, x, text, attr=0):\n"
+            "    y_int = int(y)\n"
+            "    x_int = int(x)\n"
+            f"    if 0 <= y_int < {self.height} and 0 <= x_int < {self.width - 1}:\n"
+            "        if len(text) == 1:\n"
+            "            self._curr[y_int, x_int] = text\n"
+            "            self._curr_attr[y_int, x_int] = attr\n"
+            "            return\n"
+            f"        max_len = {self.width - 1} - x_int\n"
+            "        end = x_int + min(len(text), max_len)\n"
+            "        self._curr[y_int, x_int:end] = list(text[:max_len])\n"
+            "        self._curr_attr[y_int, x_int:end] = attr\n"
+        )
+        namespace = {}
+        exec(compile(src, '<size-specialized>', 'exec'), namespace)
+        self._safe_addstr = namespace['_safe_addstr'].__get__(self)
+
+    def _flush_frame(self) -> None:
+        """
+        Emit only the cells that changed since the previous frame.
+
+        Adjacent changed cells sharing an attribute are coalesced into a
+        single addstr of the whole run, so a moved sprite costs one
+        Python->curses call instead of one per character.
+        """
+        diff = (self._curr != self._prev) | (self._curr_attr != self._prev_attr)
+        screen = self.screen
+        for y in np.flatnonzero(diff.any(axis=1)).tolist():
+            chars = self._curr[y]
+            attrs = self._curr_attr[y]
+            xs = np.flatnonzero(diff[y]).tolist()
+
+            start = prev_x = xs[0]
+            run_attr = int(attrs[start])
+            for x in xs[1:] + [-1]:
+                if x == prev_x + 1 and int(attrs[x]) == run_attr:
+                    prev_x = x
+                    continue
+                # Flush the finished run, then start a new one
+                text = ''.join(chars[start:prev_x + 1].tolist())
+                try:
+                    screen.addstr(y, start, text, run_attr)
+                except curses.error:
+                    pass  # Ignore curses errors at boundaries
+                if x >= 0:
+                    start = prev_x = x
+                    run_attr = int(attrs[x])
+
+        # Swap buffers; next frame composes over the old previous one
+        self._prev, self._curr = self._curr, self._prev
+        self._prev_attr, self._curr_attr = self._curr_attr, self._prev_attr
+
     def render(self) -> None:
         """Render the game to the screen."""
         if self.test_mode or not self.screen:
             return
 
-        self.screen.clear()
+        # Compose the frame into the shadow buffer; no full-screen clear,
+        # the diff against the previous frame decides what gets redrawn
+        np.copyto(self._curr, self._blank_chars)
+        np.copyto(self._curr_attr, self._blank_attrs)
 
-        # Handle flash effect
-        if self.flash_active:
-            self.screen.bkgd(' ', curses.color_pair(COLOR_GAME_OVER))
-        else:
-            self.screen.bkgd(' ')
+        # Handle flash effect (bkgd repaints every cell behind curses'
+        # back, so force a full redraw whenever it toggles)
+        if self.flash_active != self._flash_drawn:
+            if self.flash_active:
+                self.screen.bkgd(' ', self.attr['game_over'])
+            else:
+                self.screen.bkgd(' ')
+            self._prev_attr[:] = -1
+            self._flash_drawn = self.flash_active
 
         if self.state == GameState.MENU:
             self._render_menu()
@@ -791,7 +1208,22 @@ class Game:
         elif self.state == GameState.LEVEL_TRANSITION:
             self._render_level_transition()
 
-        self.screen.refresh()
+        # Wrap the terminal write in DEC 2026 escapes where supported so
+        # the frame is presented atomically (os.write bypasses Python
+        # buffering and goes out ahead of curses' own output)
+        if self._sync_output:
+            os.write(1, SYNC_BEGIN)
+
+        self._flush_frame()
+
+        # Stage the update and let doupdate() compose a single batched
+        # write; ncurses' dirty-line tracking then only re-emits the
+        # lines the diff above actually touched
+        self.screen.noutrefresh()
+        curses.doupdate()
+
+        if self._sync_output:
+            os.write(1, SYNC_END)
 
     def _render_menu(self) -> None:
         """Render the main menu."""
@@ -801,11 +1233,11 @@ class Game:
 
         center_y = self.height // 2
         self._safe_addstr(center_y - 2, (self.width - len(title)) // 2,
-                         title, curses.color_pair(COLOR_TEXT) | curses.A_BOLD)
+                         title, self.attr['text_bold'])
         self._safe_addstr(center_y, (self.width - len(subtitle)) // 2,
-                         subtitle, curses.color_pair(COLOR_TEXT))
+                         subtitle, self.attr['text'])
         self._safe_addstr(center_y + 2, (self.width - len(controls)) // 2,
-                         controls, curses.color_pair(COLOR_TEXT))
+                         controls, self.attr['text'])
 
     def _render_game(self) -> None:
         """Render the main gameplay."""
@@ -814,35 +1246,48 @@ class Game:
         lives_display = f"Lives: {'<A> ' * self.player.lives}"
         level_text = f"Level: {self.level}"
 
-        self._safe_addstr(0, 2, score_text, curses.color_pair(COLOR_TEXT))
+        self._safe_addstr(0, 2, score_text, self.attr['text'])
         self._safe_addstr(0, self.width // 2 - len(level_text) // 2,
-                         level_text, curses.color_pair(COLOR_TEXT))
+                         level_text, self.attr['text'])
         self._safe_addstr(0, self.width - len(lives_display) - 2,
-                         lives_display, curses.color_pair(COLOR_TEXT))
-
-        # Render aliens
-        for alien in self.aliens:
-            char = ALIEN_CHARS[alien.alien_type][self.alien_animation_frame]
-            self._safe_addstr(alien.y, alien.x, char, curses.color_pair(COLOR_ALIEN))
-
-        # Render bunkers
-        for bunker in self.bunkers:
-            if bunker.health > 0:
-                self._safe_addstr(bunker.y, bunker.x, bunker.char,
-                                 curses.color_pair(COLOR_BUNKER))
+                         lives_display, self.attr['text'])
+
+        # Render aliens: gather every live alien's glyph columns in one
+        # indexing op and stamp them straight into the shadow buffer
+        # (animation frame derived branchlessly from tick)
+        frame = (self.tick >> ANIMATION_TICK_SHIFT) & 1
+        if frame != self._glyph_frame:
+            self._glyph_frame = frame
+            self._frame_glyphs = np.ascontiguousarray(ALIEN_GLYPHS[:, frame])
+        idx = self._alive_indices()
+        if idx.size:
+            xs = self.alien_x[idx].astype(np.intp)
+            ys = self.alien_y[idx].astype(np.intp)
+            chars = self._frame_glyphs[self.alien_type[idx]]
+            attr = self.attr['alien']
+            for col in range(chars.shape[1]):
+                self._curr[ys, xs + col] = chars[:, col]
+                self._curr_attr[ys, xs + col] = attr
+
+        # Render bunkers: stamp standing cells straight into the shadow
+        # buffer, glyph gathered by health in one indexing op
+        bidx = np.flatnonzero(self.bunker_health > 0)
+        if bidx.size:
+            bxs = self.bunker_x[bidx].astype(np.intp)
+            bys = self.bunker_y[bidx].astype(np.intp)
+            self._curr[bys, bxs] = BUNKER_GLYPHS[self.bunker_health[bidx]]
+            self._curr_attr[bys, bxs] = self.attr['bunker']
 
         # Render player
         self._safe_addstr(self.player.y, self.player.x, PLAYER_CHAR,
-                         curses.color_pair(COLOR_PLAYER))
+                         self.attr['player'])
 
         # Render projectiles
-        for proj in self.player_projectiles:
-            self._safe_addstr(proj['y'], proj['x'], PROJECTILE_PLAYER,
-                             curses.color_pair(COLOR_PROJECTILE))
+        for x, y in self._pproj:
+            self._safe_addstr(y, x, PROJECTILE_PLAYER, self.attr['projectile'])
 
-        for proj in self.alien_projectiles:
-            self._safe_addstr(proj['y'], proj['x'], PROJECTILE_ALIEN,
-                             curses.color_pair(COLOR_GAME_OVER))
+        for x, y in self._aproj:
+            self._safe_addstr(y, x, PROJECTILE_ALIEN, self.attr['game_over'])
 
     def _render_game_over(self) -> None:
         """Render the game over screen."""
@@ -854,9 +1299,9 @@ class Game:
         center_y = self.height // 2
         self._safe_addstr(center_y, (self.width - len(game_over_text)) // 2,
                          game_over_text,
-                         curses.color_pair(COLOR_GAME_OVER) | curses.A_BOLD)
+                         self.attr['game_over_bold'])
         self._safe_addstr(center_y + 2, (self.width - len(restart_text)) // 2,
-                         restart_text, curses.color_pair(COLOR_TEXT))
+                         restart_text, self.attr['text'])
 
     def _render_level_transition(self) -> None:
         """Render level transition screen with bonus lives info."""
@@ -868,28 +1313,32 @@ class Game:
         center_y = self.height // 2
         self._safe_addstr(center_y - 2, (self.width - len(level_text)) // 2,
                          level_text,
-                         curses.color_pair(COLOR_TEXT) | curses.A_BOLD)
+                         self.attr['text_bold'])
         self._safe_addstr(center_y, (self.width - len(bonus_text)) // 2,
                          bonus_text,
-                         curses.color_pair(COLOR_PLAYER) | curses.A_BOLD)
+                         self.attr['player_bold'])
         self._safe_addstr(center_y + 1, (self.width - len(lives_text)) // 2,
-                         lives_text, curses.color_pair(COLOR_TEXT))
+                         lives_text, self.attr['text'])
         self._safe_addstr(center_y + 3, (self.width - len(continue_text)) // 2,
-                         continue_text, curses.color_pair(COLOR_TEXT))
+                         continue_text, self.attr['text'])
 
     def _safe_addstr(self, y, x, text: str, attr: int = 0) -> None:
-        """Safely add string to screen, handling boundary issues."""
-        try:
-            # Convert to int to handle float coordinates from projectile speed
-            y_int = int(y)
-            x_int = int(x)
-            if 0 <= y_int < self.height and 0 <= x_int < self.width:
-                # Truncate if necessary
-                max_len = self.width - x_int - 1
-                if max_len > 0:
-                    self.screen.addstr(y_int, x_int, text[:max_len], attr)
-        except curses.error:
-            pass  # Ignore curses errors at boundaries
+        """Paint a string into the shadow frame buffer, clipping at bounds."""
+        # Convert to int to handle float coordinates from projectile speed
+        y_int = int(y)
+        x_int = int(x)
+        if 0 <= y_int < self.height and 0 <= x_int < self.width - 1:
+            # Single characters (projectiles, the player glyph) skip the
+            # truncation work entirely
+            if len(text) == 1:
+                self._curr[y_int, x_int] = text
+                self._curr_attr[y_int, x_int] = attr
+                return
+            # Truncate if necessary
+            max_len = self.width - x_int - 1
+            end = x_int + min(len(text), max_len)
+            self._curr[y_int, x_int:end] = list(text[:max_len])
+            self._curr_attr[y_int, x_int:end] = attr
 
     def run(self) -> None:
         """Main game loop with curses."""
@@ -897,8 +1346,7 @@ class Game:
             # Setup curses
             self.screen = stdscr
             curses.curs_set(0)  # Hide cursor
-            stdscr.nodelay(True)  # Non-blocking input
-            stdscr.timeout(INPUT_TIMEOUT_MS)  # Fast input polling for responsive movement
+            stdscr.nodelay(True)  # Non-blocking input; the loop blocks in select()
 
             # Initialize colors
             curses.start_color()
@@ -910,6 +1358,9 @@ class Game:
             curses.init_pair(COLOR_PROJECTILE, curses.COLOR_WHITE, -1)
             curses.init_pair(COLOR_GAME_OVER, curses.COLOR_RED, -1)
 
+            # Resolve color_pair lookups once, now that pairs exist
+            self._init_attrs(live=True)
+
             # Get screen dimensions
             self.height, self.width = stdscr.getmaxyx()
 
@@ -924,6 +1375,7 @@ class Game:
             self._init_player_position()
             self._init_aliens()
             self._init_bunkers()
+            self._init_frame_buffers()
 
             # Setup audio with global reference for cleanup
             global _audio_manager
@@ -931,9 +1383,22 @@ class Game:
             _audio_manager = self.audio
 
             running = True
+            prev_ns = time.perf_counter_ns()
+            acc_ns = 0
             try:
                 while running:
-                    frame_start = time.time()
+                    # Fixed-timestep loop: accumulate real elapsed time,
+                    # run whole update ticks, render once. When the
+                    # terminal is slow, render frames are dropped while
+                    # game speed stays stable.
+                    now_ns = time.perf_counter_ns()
+                    acc_ns += now_ns - prev_ns
+                    prev_ns = now_ns
+
+                    # Cap the backlog so a long stall doesn't trigger a
+                    # spiral of catch-up updates
+                    if acc_ns > 4 * FRAME_NS:
+                        acc_ns = 4 * FRAME_NS
 
                     # Handle input
                     try:
@@ -943,17 +1408,26 @@ class Game:
                     except Exception:
                         pass
 
-                    # Update game state
-                    self.update()
+                    # Update game state in fixed ticks
+                    while acc_ns >= FRAME_NS:
+                        self.update()
+                        acc_ns -= FRAME_NS
 
                     # Render
                     self.render()
 
-                    # Frame rate limiting
-                    elapsed = time.time() - frame_start
-                    sleep_time = FRAME_TIME - elapsed
-                    if sleep_time > 0:
-                        time.sleep(sleep_time)
+                    # Block until input arrives or the next tick is due;
+                    # unlike a fixed curses timeout this is a single
+                    # kernel-level wait with no spurious wakeups, and a
+                    # keypress is handled as soon as it lands
+                    remaining_ns = (FRAME_NS - acc_ns
+                                    - (time.perf_counter_ns() - prev_ns))
+                    if remaining_ns > 0:
+                        try:
+                            select.select([sys.stdin], [], [],
+                                          remaining_ns * 1e-9)
+                        except (OSError, ValueError):
+                            time.sleep(remaining_ns * 1e-9)
             finally:
                 # Always cleanup audio, even on crash
                 if self.audio: